@@ -1,8 +1,10 @@
+import json
 import math
 
 import compas
 import numpy
 import pytest
+from pyrebase.pyrebase import Database
 
 import compas_xr
 
@@ -36,3 +38,32 @@ def add_math(doctest_namespace):
 @pytest.fixture(autouse=True)
 def add_np(doctest_namespace):
     doctest_namespace["np"] = numpy
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    config_path = tmp_path / "config_compas_xr.json"
+    data = {
+        "apiKey": "x123x123",
+        "authDomain": "x123.firebaseapp.com",
+        "databaseURL": "https://x123-default-rtdb.europe-west1.firebasedatabase.app",
+        "storageBucket": "x123.appspot.com",
+    }
+    config_path.write_text(json.dumps(data))
+    return str(config_path)
+
+
+@pytest.fixture
+def requests_sent(monkeypatch):
+    requests_sent = []
+
+    def record(method):
+        def send(self, data, token=None, json_kwargs=None):
+            requests_sent.append((method, self.path, json.loads(json.dumps(data, **(json_kwargs or {})))))
+            self.path = ""
+
+        return send
+
+    monkeypatch.setattr(Database, "set", record("set"))
+    monkeypatch.setattr(Database, "update", record("update"))
+    return requests_sent
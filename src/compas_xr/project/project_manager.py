@@ -34,7 +34,7 @@ class ProjectManager(object):
         self.storage = Storage(config_path)
         self.database = RealtimeDatabase(config_path)
 
-    def application_settings_writer(self, project_name, storage_folder="None", z_to_y_remap=False):
+    def application_settings_writer(self, project_name, storage_folder="None", z_to_y_remap=False, wait=True):
         """
         Uploads required application settings to the Firebase RealtimeDatabase.
 
@@ -46,14 +46,17 @@ class ProjectManager(object):
             The name of the storage folder, by default "None"
         z_to_y_remap : bool, optional
             The orientation of the object, if the obj was exported with z to y remap, by default False
+        wait : bool, optional
+            If False, the write is run in the background where the database implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the database runs it in the background.
 
         """
         data = {"project_name": project_name, "storage_folder": storage_folder, "z_to_y_remap": z_to_y_remap}
-        self.database.upload_data(data, "ApplicationSettings")
+        return self.database.upload_data(data, "ApplicationSettings", wait=wait)
 
     def create_project_data_from_compas(self, assembly, building_plan, qr_frames_list):
         """
@@ -91,7 +94,7 @@ class ProjectManager(object):
             }
         return data
 
-    def upload_data_to_project(self, data, project_name, data_name):
+    def upload_data_to_project(self, data, project_name, data_name, wait=True):
         """
         Uploads data to the Firebase RealtimeDatabase under the specified project name.
 
@@ -103,15 +106,18 @@ class ProjectManager(object):
             The name of the project under which the data will be stored.
         data_name : str
             The name of the child in which data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the database implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the database runs it in the background.
 
         """
-        self.database.upload_data_to_reference_as_child(data, project_name, data_name)
+        return self.database.upload_data_to_reference_as_child(data, project_name, data_name, wait=wait)
 
-    def upload_project_data_from_compas(self, project_name, assembly, building_plan, qr_frames_list):
+    def upload_project_data_from_compas(self, project_name, assembly, building_plan, qr_frames_list, wait=True):
         """
         Formats data structure from COMPAS Class Objects and uploads them to the RealtimeDatabase under project name.
 
@@ -125,16 +131,19 @@ class ProjectManager(object):
             List of frames at specific locations for application localization data.
         project_name : str
             The name of the project under which the data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the database implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the database runs it in the background.
 
         """
         data = self.create_project_data_from_compas(assembly, building_plan, qr_frames_list)
-        self.database.upload_data(data, project_name)
+        return self.database.upload_data(data, project_name, wait=wait)
 
-    def upload_qr_frames_to_project(self, project_name, qr_frames_list):
+    def upload_qr_frames_to_project(self, project_name, qr_frames_list, wait=True):
         """
         Uploads QR Frames to the Firebase RealtimeDatabase under the specified project name.
 
@@ -144,15 +153,18 @@ class ProjectManager(object):
             List of frames at specific locations for application localization data.
         project_name : str
             The name of the project under which the data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the database implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the database runs it in the background.
 
         """
         qr_assembly = AssemblyExtensions().create_qr_assembly(qr_frames_list)
         data = qr_assembly.__data__
-        self.database.upload_data_to_reference_as_child(data, project_name, "QRFrames")
+        return self.database.upload_data_to_reference_as_child(data, project_name, "QRFrames", wait=wait)
 
     def upload_obj_to_storage(self, path_local, storage_folder_name):
         """
@@ -244,10 +256,14 @@ class ProjectManager(object):
         """
         return self.storage.get_data(cloud_file_name)
 
-    def edit_step_on_database(self, project_name, key, actor, is_built, is_planned, priority):
+    def edit_step_on_database(self, project_name, key, actor, is_built, is_planned, priority, wait=True):
         """
         Edits a building plan step in the Firebase RealtimeDatabase under the specified project name.
 
+        Only the given values are written, in a single request; the step is not retrieved first.
+        The key is therefore not checked: a key without a step creates a partial step that holds only these values,
+        which cannot be loaded as a BuildingPlan by ``visualize_project_state`` afterwards.
+
         Parameters
         ----------
         project_name : str
@@ -262,19 +278,52 @@ class ProjectManager(object):
             A boolean that determines if the step is planned.
         priority : int
             The priority of the step.
+        wait : bool, optional
+            If False, the write is run in the background where the database implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the database runs it in the background.
 
         """
         database_reference_list = [project_name, "building_plan", "data", "steps", key, "data"]
-        current_data = self.database.get_data_from_deep_reference(database_reference_list)
-        current_data["actor"] = actor
-        current_data["is_built"] = is_built
-        current_data["is_planned"] = is_planned
-        current_data["priority"] = priority
-        self.database.upload_data_to_deep_reference(current_data, database_reference_list)
+        data = {"actor": actor, "is_built": is_built, "is_planned": is_planned, "priority": priority}
+        return self.database.update_data_to_deep_reference(data, database_reference_list, wait=wait)
+
+    def edit_steps_on_database(self, project_name, steps_data, wait=True):
+        """
+        Edits several building plan steps in the Firebase RealtimeDatabase under the specified project name in a single request.
+
+        Only the given values are written; the steps are not retrieved first and the keys are therefore not checked.
+        A key without a step creates a partial step that holds only the given values,
+        which cannot be loaded as a BuildingPlan by ``visualize_project_state`` afterwards.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project under which the data will be stored.
+        steps_data : dict
+            The values to be edited for each step, keyed by the key of the building plan step.
+            For example ``{"0": {"actor": "HUMAN", "is_built": True, "is_planned": False, "priority": 0}}``.
+        wait : bool, optional
+            If False, the write is run in the background where the database implementation supports it. Default is True.
+
+        Returns
+        -------
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the database runs it in the background.
+            None without sending a request if steps_data holds no values.
+
+        """
+        database_reference_list = [project_name, "building_plan", "data", "steps"]
+        data = {}
+        for key, step_data in steps_data.items():
+            for name, value in step_data.items():
+                data["{}/data/{}".format(key, name)] = value
+        if not data:
+            return None
+        return self.database.update_data_to_deep_reference(data, database_reference_list, wait=wait)
 
     def visualize_project_state_timbers(self, timber_assembly, project_name):
         """
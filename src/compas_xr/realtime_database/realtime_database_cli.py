@@ -48,9 +48,12 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         The FirebaseClient instance representing the connection to the Firebase Realtime Database.
     _shared_database : FirebaseClient, class attribute
         The shared FirebaseClient instance representing the connection to the Firebase Realtime Database.
+    _init_lock : :class:`threading.Lock`, class attribute
+        The lock that ensures the shared database is initialized only once when instances are created from several threads.
     """
 
     _shared_database = None
+    _init_lock = threading.Lock()
 
     def __init__(self, config_path):
         self.config_path = config_path
@@ -63,15 +66,19 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         If the connection is already established, it returns the existing connection.
         """
         if not RealtimeDatabase._shared_database:
-            path = self.config_path
-            if not os.path.exists(path):
-                raise Exception("Could not find config file at path {}!".format(path))
-            with open(path) as config_file:
-                config = json.load(config_file)
-            # TODO: Database Authorization (Works only with public databases)
-            database_url = config["databaseURL"]
-            database_client = FirebaseClient(database_url)
-            RealtimeDatabase._shared_database = database_client
+            with RealtimeDatabase._init_lock:
+                if not RealtimeDatabase._shared_database:
+                    path = self.config_path
+                    if not os.path.exists(path):
+                        raise Exception("Could not find config file at path {}!".format(path))
+                    with open(path) as config_file:
+                        config = json.load(config_file)
+                    # TODO: Database Authorization (Works only with public databases)
+                    if "databaseURL" not in config:
+                        raise Exception("Config file at path {} is missing the key 'databaseURL'!".format(path))
+                    database_url = config["databaseURL"]
+                    database_client = FirebaseClient(database_url)
+                    RealtimeDatabase._shared_database = database_client
 
         if not RealtimeDatabase._shared_database:
             raise Exception("Could not initialize Database!")
@@ -193,14 +200,13 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
 
         """
         reference = RealtimeDatabase._shared_database
-        for ref in reference_list:
-            if ref == reference_list[0]:
-                reference = reference.Child(ref)
-            else:
+        if reference_list:
+            reference = reference.Child(reference_list[0])
+            for ref in reference_list[1:]:
                 reference = QueryExtensions.Child(reference, ref)
         return reference
 
-    def delete_data_from_reference(self, database_reference):
+    def delete_data_from_reference(self, database_reference, wait=True):
         """
         Method for deleting data from a constructed database reference.
 
@@ -208,6 +214,8 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         ----------
         database_reference: 'Firebase.Database.Query.ChildQuery'
             Reference to the database location where the data will be deleted from.
+        wait : bool, optional
+            Only for compatibility with the pyrebase implementation, the IronPython client always waits for the deletion to complete.
 
         Returns
         -------
@@ -264,7 +272,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
     def stream_data_from_reference(self, callback, database_reference):
         raise NotImplementedError("Function Under Developement")
 
-    def upload_data_to_reference(self, data, database_reference):
+    def upload_data_to_reference(self, data, database_reference, wait=True):
         """
         Method for uploading data to a constructed database reference.
 
@@ -274,6 +282,8 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The data to be uploaded. Data should be JSON serializable.
         database_reference: 'Firebase.Database.Query.ChildQuery'
             Reference to the database location where the data will be uploaded.
+        wait : bool, optional
+            Only for compatibility with the pyrebase implementation, the IronPython client always waits for the upload to complete.
 
         Returns
         -------
@@ -290,3 +300,36 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             result["data"] = True
 
         self._start_async_call(_begin_upload)
+
+    def update_data_to_reference(self, data, database_reference, wait=True):
+        """
+        Method for updating the children of a constructed database reference in a single request.
+
+        Only the children named in data are written, all other children of the reference are left untouched.
+
+        Parameters
+        ----------
+        data : dict
+            The children to be written, keyed by child name. Values should be JSON serializable.
+        database_reference: 'Firebase.Database.Query.ChildQuery'
+            Reference to the database location where the children will be updated.
+        wait : bool, optional
+            Only for compatibility with the pyrebase implementation, the IronPython client always waits for the update to complete.
+
+        Returns
+        -------
+        None
+        """
+        self._ensure_database()
+        if not isinstance(data, dict):
+            raise TypeError("Data to update must be a dict of children, got {}!".format(type(data).__name__))
+        serialized_data = json_dumps(data)
+
+        def _begin_update(result):
+            updatetask = database_reference.PatchAsync(serialized_data)
+            task_update = updatetask.GetAwaiter()
+            task_update.OnCompleted(lambda: result["event"].set())
+            result["event"].wait()
+            result["data"] = True
+
+        self._start_async_call(_begin_update)
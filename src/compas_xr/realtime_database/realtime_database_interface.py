@@ -22,19 +22,22 @@ class RealtimeDatabaseInterface(object):
     def construct_reference_from_list(self, reference_list):
         raise NotImplementedError("Implemented on child classes")
 
-    def upload_data_to_reference(self, data, database_reference):
+    def upload_data_to_reference(self, data, database_reference, wait=True):
+        raise NotImplementedError("Implemented on child classes")
+
+    def update_data_to_reference(self, data, database_reference, wait=True):
         raise NotImplementedError("Implemented on child classes")
 
     def get_data_from_reference(self, database_reference):
         raise NotImplementedError("Implemented on child classes")
 
-    def delete_data_from_reference(self, database_reference):
+    def delete_data_from_reference(self, database_reference, wait=True):
         raise NotImplementedError("Implemented on child classes")
 
     def stream_data_from_reference(self, callback, database_reference):
         raise NotImplementedError("Implemented on child classes")
 
-    def upload_data(self, data, reference_name):
+    def upload_data(self, data, reference_name, wait=True):
         """
         Uploads data to the Firebase Realtime Database under specified reference name.
 
@@ -44,16 +47,19 @@ class RealtimeDatabaseInterface(object):
             The data to be uploaded, needs to be JSON serializable.
         reference_name : str
             The name of the reference under which the data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         database_reference = self.construct_reference(reference_name)
-        self.upload_data_to_reference(data, database_reference)
+        return self.upload_data_to_reference(data, database_reference, wait=wait)
 
-    def upload_data_to_reference_as_child(self, data, reference_name, child_name):
+    def upload_data_to_reference_as_child(self, data, reference_name, child_name, wait=True):
         """
         Uploads data to the Firebase Realtime Database under specified reference name & child name.
 
@@ -65,16 +71,19 @@ class RealtimeDatabaseInterface(object):
             The name of the reference under which the child should exist.
         child_name : str
             The name of the reference under which the data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         database_reference = self.construct_child_refrence(reference_name, child_name)
-        self.upload_data_to_reference(data, database_reference)
+        return self.upload_data_to_reference(data, database_reference, wait=wait)
 
-    def upload_data_to_deep_reference(self, data, reference_list):
+    def upload_data_to_deep_reference(self, data, reference_list, wait=True):
         """
         Uploads data to the Firebase Realtime Database under specified reference names in list order.
 
@@ -84,16 +93,87 @@ class RealtimeDatabaseInterface(object):
             The data to be uploaded, needs to be JSON serializable.
         reference_list : list of str
             The names in sequence order in which the data should be nested for upload.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         database_reference = self.construct_reference_from_list(reference_list)
-        self.upload_data_to_reference(data, database_reference)
+        return self.upload_data_to_reference(data, database_reference, wait=wait)
+
+    def update_data(self, data, reference_name, wait=True):
+        """
+        Updates the children of the specified reference name in the Firebase Realtime Database in a single request.
+
+        Parameters
+        ----------
+        data : dict
+            The children to be written, keyed by child name. Values need to be JSON serializable.
+        reference_name : str
+            The name of the reference under which the children will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
+
+        Returns
+        -------
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
+
+        """
+        database_reference = self.construct_reference(reference_name)
+        return self.update_data_to_reference(data, database_reference, wait=wait)
+
+    def update_data_to_reference_as_child(self, data, reference_name, child_name, wait=True):
+        """
+        Updates the children of the specified reference name & child name in the Firebase Realtime Database in a single request.
+
+        Parameters
+        ----------
+        data : dict
+            The children to be written, keyed by child name. Values need to be JSON serializable.
+        reference_name : str
+            The name of the reference under which the child should exist.
+        child_name : str
+            The name of the reference under which the children will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
+
+        Returns
+        -------
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
-    def upload_data_from_file(self, path_local, refernce_name):
+        """
+        database_reference = self.construct_child_refrence(reference_name, child_name)
+        return self.update_data_to_reference(data, database_reference, wait=wait)
+
+    def update_data_to_deep_reference(self, data, reference_list, wait=True):
+        """
+        Updates the children of the specified reference names in list order in the Firebase Realtime Database in a single request.
+
+        Parameters
+        ----------
+        data : dict
+            The children to be written, keyed by child name. Values need to be JSON serializable.
+        reference_list : list of str
+            The names in sequence order in which the children should be nested.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
+
+        Returns
+        -------
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
+
+        """
+        database_reference = self.construct_reference_from_list(reference_list)
+        return self.update_data_to_reference(data, database_reference, wait=wait)
+
+    def upload_data_from_file(self, path_local, refernce_name, wait=True):
         """
         Uploads data to the Firebase Realtime Database under specified reference name from a file.
 
@@ -103,10 +183,13 @@ class RealtimeDatabaseInterface(object):
             The local path in which the data is stored as a json file.
         reference_name : str
             The name of the reference under which the data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         if not os.path.exists(path_local):
@@ -114,7 +197,7 @@ class RealtimeDatabaseInterface(object):
         with open(path_local) as config_file:
             data = json.load(config_file)
         database_reference = self.construct_reference(refernce_name)
-        self.upload_data_to_reference(data, database_reference)
+        return self.upload_data_to_reference(data, database_reference, wait=wait)
 
     def get_data(self, reference_name):
         """
@@ -173,7 +256,69 @@ class RealtimeDatabaseInterface(object):
         database_reference = self.construct_reference_from_list(reference_list)
         return self.get_data_from_reference(database_reference)
 
-    def delete_data(self, reference_name):
+    def stream_data(self, callback, reference_name):
+        """
+        Subscribes to changes of the data in the Firebase Realtime Database under the specified reference name.
+
+        Parameters
+        ----------
+        callback : callable
+            Function called with each message of the stream.
+        reference_name : str
+            The name of the reference under which the data is stored.
+
+        Returns
+        -------
+        stream : object
+            The running stream.
+
+        """
+        database_reference = self.construct_reference(reference_name)
+        return self.stream_data_from_reference(callback, database_reference)
+
+    def stream_data_from_child_reference(self, callback, reference_name, child_name):
+        """
+        Subscribes to changes of the data in the Firebase Realtime Database under the specified reference name & child name.
+
+        Parameters
+        ----------
+        callback : callable
+            Function called with each message of the stream.
+        reference_name : str
+            The name of the reference under which the child exists.
+        child_name : str
+            The name of the reference under which the data is stored.
+
+        Returns
+        -------
+        stream : object
+            The running stream.
+
+        """
+        database_reference = self.construct_child_refrence(reference_name, child_name)
+        return self.stream_data_from_reference(callback, database_reference)
+
+    def stream_data_from_deep_reference(self, callback, reference_list):
+        """
+        Subscribes to changes of the data in the Firebase Realtime Database under the specified reference names in list order.
+
+        Parameters
+        ----------
+        callback : callable
+            Function called with each message of the stream.
+        reference_list : list of str
+            The names in sequence order in which the data is nested.
+
+        Returns
+        -------
+        stream : object
+            The running stream.
+
+        """
+        database_reference = self.construct_reference_from_list(reference_list)
+        return self.stream_data_from_reference(callback, database_reference)
+
+    def delete_data(self, reference_name, wait=True):
         """
         Deletes data from the Firebase Realtime Database under specified reference name.
 
@@ -181,16 +326,19 @@ class RealtimeDatabaseInterface(object):
         ----------
         reference_name : str
             The name of the reference under which the child should exist.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         database_reference = self.construct_reference(reference_name)
-        self.delete_data_from_reference(database_reference)
+        return self.delete_data_from_reference(database_reference, wait=wait)
 
-    def delete_data_from_child_reference(self, reference_name, child_name):
+    def delete_data_from_child_reference(self, reference_name, child_name, wait=True):
         """
         Deletes data from the Firebase Realtime Database under specified reference name & child name.
 
@@ -200,16 +348,19 @@ class RealtimeDatabaseInterface(object):
             The name of the reference under which the child should exist.
         child_name : str
             The name of the reference under which the data will be stored.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         database_reference = self.construct_child_refrence(reference_name, child_name)
-        self.delete_data_from_reference(database_reference)
+        return self.delete_data_from_reference(database_reference, wait=wait)
 
-    def delete_data_from_deep_reference(self, reference_list):
+    def delete_data_from_deep_reference(self, reference_list, wait=True):
         """
         Deletes data from the Firebase Realtime Database under specified reference names in list order.
 
@@ -217,11 +368,14 @@ class RealtimeDatabaseInterface(object):
         ----------
         reference_list : list of str
             The names in sequence order in which the data should be nested for upload.
+        wait : bool, optional
+            If False, the write is run in the background where the implementation supports it. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the write if wait is False and the implementation runs it in the background.
 
         """
         database_reference = self.construct_reference_from_list(reference_list)
-        self.delete_data_from_reference(database_reference)
+        return self.delete_data_from_reference(database_reference, wait=wait)
@@ -4,13 +4,34 @@ from __future__ import print_function
 
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 
 import pyrebase
-from compas.data import json_dumps
+from compas.data import DataEncoder
+from pyrebase.pyrebase import Database
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from compas_xr.realtime_database.realtime_database_interface import RealtimeDatabaseInterface
 
 
+class _GuidDataEncoder(DataEncoder):
+    """
+    DataEncoder that always includes the guids of COMPAS objects.
+
+    DataEncoder reads its minimal flag from the class, which ``compas.data.json_dumps`` sets on any thread,
+    so the flag cannot be reset safely for an upload that is encoded on the write worker.
+    """
+
+    def default(self, o):
+        if hasattr(o, "__jsondump__"):
+            return o.__jsondump__(minimal=False)
+        return super(_GuidDataEncoder, self).default(o)
+
+
 class RealtimeDatabase(RealtimeDatabaseInterface):
     """
     A RealtimeDatabase is defined by a Firebase configuration path and a shared database reference.
@@ -22,21 +43,37 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
     ----------
     config_path : str
         The path to the Firebase configuration JSON file.
+    cache_ttl : float, optional
+        The number of seconds for which retrieved data is reused before it is fetched again.
+        Writes made through this instance clear the affected entries and references with a query are not cached.
+        Default is None, which disables the cache.
 
     Attributes
     ----------
     config_path : str
         The path to the Firebase configuration JSON file.
+    cache_ttl : float
+        The number of seconds for which retrieved data is reused before it is fetched again.
     database : Database
         The Database instance representing the connection to the Firebase Realtime Database.
     _shared_database : Database, class attribute
         The shared Database instance representing the connection to the Firebase Realtime Database.
+    _executor : :class:`concurrent.futures.ThreadPoolExecutor`, class attribute
+        The single worker on which all writes are run, so they reach the database in the order they were made.
+    _init_lock : :class:`threading.Lock`, class attribute
+        The lock that ensures the shared database is initialized only once when instances are created from several threads.
     """
 
     _shared_database = None
+    _executor = None
+    _init_lock = threading.Lock()
 
-    def __init__(self, config_path):
+    def __init__(self, config_path, cache_ttl=None):
         self.config_path = config_path
+        self.cache_ttl = cache_ttl
+        self._read_cache = {}
+        self._pending_reads = {}
+        self._cache_lock = threading.Lock()
         self._ensure_database()
 
     def _ensure_database(self):
@@ -46,19 +83,55 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         If the connection is already established, it returns the existing connection.
         """
         if not RealtimeDatabase._shared_database:
-            path = self.config_path
-
-            if not os.path.exists(path):
-                raise Exception("Could not find config file at path {}!".format(path))
-            with open(path) as config_file:
-                config = json.load(config_file)
-            # TODO: Database Authorization (Works only with public databases)
-            firebase = pyrebase.initialize_app(config)
-            RealtimeDatabase._shared_database = firebase.database()
+            with RealtimeDatabase._init_lock:
+                if not RealtimeDatabase._shared_database:
+                    path = self.config_path
+
+                    if not os.path.exists(path):
+                        raise FileNotFoundError("Could not find config file at path {}!".format(path))
+                    with open(path) as config_file:
+                        config = json.load(config_file)
+                    # TODO: Database Authorization (Works only with public databases)
+                    try:
+                        firebase = pyrebase.initialize_app(config)
+                    except KeyError as e:
+                        raise Exception("Config file at path {} is missing the key {}!".format(path, e)) from e
+                    # All references share this session, retry requests whose connection failed before reaching Firebase.
+                    firebase.requests.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.1)))
+                    RealtimeDatabase._executor = ThreadPoolExecutor(max_workers=1)
+                    RealtimeDatabase._shared_database = firebase.database()
 
         if not RealtimeDatabase._shared_database:
             raise Exception("Could not initialize database!")
 
+    def _paths_overlap(self, path_a, path_b):
+        """
+        Returns True if one of the paths is equal to, or a parent of, the other path.
+        """
+        shorter, longer = sorted((path_a, path_b), key=len)
+        return not shorter or longer == shorter or longer.startswith(shorter + "/")
+
+    def _invalidate_cache(self, path):
+        """
+        Removes the cached data of the given path, its parents and its children.
+        Reads of these paths that are still in flight are marked so their result is not cached.
+        """
+        with self._cache_lock:
+            for cached_path in list(self._read_cache):
+                if self._paths_overlap(cached_path, path):
+                    del self._read_cache[cached_path]
+            for pending_read in self._pending_reads.values():
+                if self._paths_overlap(pending_read["path"], path):
+                    pending_read["invalidated"] = True
+
+    def _root_reference(self):
+        """
+        Returns a new root reference that shares the connection of the shared database.
+        Pyrebase stores the path of a query on the Database object itself, so every constructed reference needs its own.
+        """
+        database = RealtimeDatabase._shared_database
+        return Database(database.credentials, database.api_key, database.database_url, database.requests)
+
     def construct_reference(self, parentname):
         """
         Constructs a database reference under the specified parent name.
@@ -74,7 +147,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        return RealtimeDatabase._shared_database.child(parentname)
+        return self._root_reference().child(parentname)
 
     def construct_child_refrence(self, parentname, childname):
         """
@@ -93,7 +166,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        return RealtimeDatabase._shared_database.child(parentname).child(childname)
+        return self._root_reference().child(parentname).child(childname)
 
     def construct_grandchild_refrence(self, parentname, childname, grandchildname):
         """
@@ -114,7 +187,7 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        return RealtimeDatabase._shared_database.child(parentname).child(childname).child(grandchildname)
+        return self._root_reference().child(parentname).child(childname).child(grandchildname)
 
     def construct_reference_from_list(self, reference_list):
         """
@@ -131,12 +204,35 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The constructed database reference.
 
         """
-        reference = RealtimeDatabase._shared_database
-        for ref in reference_list:
-            reference = reference.child(ref)
-        return reference
+        return self._root_reference().child(*reference_list)
+
+    def _submit_write(self, write, wait, *args):
+        """
+        Runs a write on the shared worker, behind all writes made before it.
+        Waiting writes also go through the worker, so they cannot overtake a write that is still running in the background.
+        """
+        future = RealtimeDatabase._executor.submit(write, *args)
+        if not wait:
+            return future
+        future.result()
 
-    def delete_data_from_reference(self, database_reference):
+    def _remove(self, database_reference):
+        path = database_reference.path
+        database_reference.remove()
+        self._invalidate_cache(path)
+
+    def _set(self, data, database_reference):
+        path = database_reference.path
+        # Pyrebase encodes the payload itself, passing the COMPAS encoder avoids a dumps/loads round trip before the upload.
+        database_reference.set(data, json_kwargs={"cls": _GuidDataEncoder})
+        self._invalidate_cache(path)
+
+    def _update(self, data, database_reference):
+        path = database_reference.path
+        database_reference.update(data, json_kwargs={"cls": _GuidDataEncoder})
+        self._invalidate_cache(path)
+
+    def delete_data_from_reference(self, database_reference, wait=True):
         """
         Method for deleting data from a constructed database reference.
 
@@ -144,13 +240,16 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
         ----------
         database_reference: 'pyrebase.pyrebase.Database'
             Reference to the database location where the data will be deleted from.
+        wait : bool, optional
+            If False, the deletion is run in the background and a future is returned immediately. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the deletion if wait is False.
         """
         self._ensure_database()
-        database_reference.remove()
+        return self._submit_write(self._remove, wait, database_reference)
 
     def get_data_from_reference(self, database_reference):
         """
@@ -168,15 +267,66 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
 
         """
         self._ensure_database()
-        database_directory = database_reference.get()
-        data = database_directory.val()
-        data_dict = dict(data)
+        path = database_reference.path
+        # The cache is keyed by path only, queries such as shallow() or order_by_child() are always fetched.
+        if not self.cache_ttl or database_reference.build_query:
+            data = database_reference.get().val()
+            return data if isinstance(data, dict) else dict(data)
+
+        token = object()
+        with self._cache_lock:
+            now = time.monotonic()
+            cached = self._read_cache.get(path)
+            if cached and now - cached[0] < self.cache_ttl:
+                return deepcopy(cached[1])
+            for cached_path, (cached_time, _) in list(self._read_cache.items()):
+                if now - cached_time >= self.cache_ttl:
+                    del self._read_cache[cached_path]
+            self._pending_reads[token] = {"path": path, "invalidated": False}
+        try:
+            database_directory = database_reference.get()
+            data = database_directory.val()
+            data_dict = data if isinstance(data, dict) else dict(data)
+        except Exception:
+            with self._cache_lock:
+                del self._pending_reads[token]
+            raise
+        with self._cache_lock:
+            # A write or stream message may have changed the data while the request was running.
+            if not self._pending_reads.pop(token)["invalidated"]:
+                self._read_cache[path] = (time.monotonic(), deepcopy(data_dict))
         return data_dict
 
     def stream_data_from_reference(self, callback, database_reference):
-        raise NotImplementedError("Function Under Developement")
+        """
+        Method for subscribing to changes of the data at a constructed database reference.
 
-    def upload_data_to_reference(self, data, database_reference):
+        The callback is first called with the current data and then with every change, so the data
+        does not need to be retrieved repeatedly to notice changes.
+
+        Parameters
+        ----------
+        callback : callable
+            Function called on a background thread with each message of the stream.
+            A message is a dictionary with the keys ``"event"`` ("put" or "patch"), ``"path"`` and ``"data"``.
+        database_reference: 'pyrebase.pyrebase.Database'
+            Reference to the database location that will be streamed.
+
+        Returns
+        -------
+        :class: 'pyrebase.pyrebase.Stream'
+            The running stream, which needs to be closed with ``close()`` when it is no longer needed.
+        """
+        self._ensure_database()
+        path = database_reference.path
+
+        def _stream_handler(message):
+            self._invalidate_cache(path)
+            callback(message)
+
+        return database_reference.stream(_stream_handler)
+
+    def upload_data_to_reference(self, data, database_reference, wait=True):
         """
         Method for uploading data to a constructed database reference.
 
@@ -186,12 +336,40 @@ class RealtimeDatabase(RealtimeDatabaseInterface):
             The data to be uploaded. Data should be JSON serializable.
         database_reference: 'pyrebase.pyrebase.Database'
             Reference to the database location where the data will be uploaded.
+        wait : bool, optional
+            If False, the upload is run in the background and a future is returned immediately.
+            The data should not be modified until the future is done. Default is True.
+
+        Returns
+        -------
+        None or :class:`concurrent.futures.Future`
+            The future of the upload if wait is False.
+        """
+        self._ensure_database()
+        return self._submit_write(self._set, wait, data, database_reference)
+
+    def update_data_to_reference(self, data, database_reference, wait=True):
+        """
+        Method for updating the children of a constructed database reference in a single request.
+
+        Only the children named in data are written, all other children of the reference are left untouched.
+
+        Parameters
+        ----------
+        data : dict
+            The children to be written, keyed by child name. Values should be JSON serializable.
+        database_reference: 'pyrebase.pyrebase.Database'
+            Reference to the database location where the children will be updated.
+        wait : bool, optional
+            If False, the update is run in the background and a future is returned immediately.
+            The data should not be modified until the future is done. Default is True.
 
         Returns
         -------
-        None
+        None or :class:`concurrent.futures.Future`
+            The future of the update if wait is False.
         """
         self._ensure_database()
-        # TODO: Check if this is stupid... it provides the functionality of making it work with compas objects and consistency across both child classes
-        json_string = json_dumps(data)
-        database_reference.set(json.loads(json_string))
+        if not isinstance(data, dict):
+            raise TypeError("Data to update must be a dict of children, got {}!".format(type(data).__name__))
+        return self._submit_write(self._update, wait, data, database_reference)
@@ -185,7 +185,10 @@ class StorageInterface(object):
             raise FileNotFoundError("Directory not found: {}".format(directory_path))
         for file_name in os.listdir(directory_path):
             file_path = os.path.join(directory_path, file_name)
-            self.upload_file_as_bytes_to_deep_reference(file_path, cloud_path_list)
+            if not os.path.isfile(file_path):
+                continue
+            storage_reference = self.construct_reference_from_list(cloud_path_list + [file_name])
+            self.upload_bytes_to_reference_from_local_file(file_path, storage_reference)
 
     # TODO: This works as it should, but I have a lot of problems with json_loads
     def get_data(self, cloud_file_name):
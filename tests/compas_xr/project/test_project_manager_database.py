@@ -0,0 +1,32 @@
+import pytest
+from compas.geometry import Frame
+from pyrebase.pyrebase import Database
+
+from compas_xr.project import ProjectManager
+
+
+def test_edit_steps_on_database(config_path, requests_sent):
+    pm = ProjectManager(config_path)
+    pm.edit_steps_on_database("project", {"0": {"is_built": True}, "1": {"is_built": False, "actor": "ROBOT"}})
+    assert requests_sent == [("update", "project/building_plan/data/steps", {"0/data/is_built": True, "1/data/is_built": False, "1/data/actor": "ROBOT"})]
+
+
+def test_edit_steps_on_database_without_values(config_path, requests_sent):
+    pm = ProjectManager(config_path)
+    assert pm.edit_steps_on_database("project", {}) is None
+    assert pm.edit_steps_on_database("project", {"0": {}}) is None
+    assert requests_sent == []
+
+
+def test_edit_step_on_database(config_path, requests_sent, monkeypatch):
+    monkeypatch.setattr(Database, "get", lambda *args, **kwargs: pytest.fail("step retrieved"))
+    pm = ProjectManager(config_path)
+    pm.edit_step_on_database("project", "0", "HUMAN", True, False, 2)
+    assert requests_sent == [("update", "project/building_plan/data/steps/0/data", {"actor": "HUMAN", "is_built": True, "is_planned": False, "priority": 2})]
+
+
+def test_upload_qr_frames_without_waiting(config_path, requests_sent):
+    pm = ProjectManager(config_path)
+    future = pm.upload_qr_frames_to_project("project", [Frame.worldXY()], wait=False)
+    future.result()
+    assert [(method, path) for method, path, data in requests_sent] == [("set", "project/QRFrames")]
@@ -0,0 +1,178 @@
+import time
+
+import pytest
+from compas.data import DataEncoder
+from compas.data import json_dumps
+from compas.geometry import Point
+from pyrebase.pyrebase import Database
+from pyrebase.pyrebase import Pyre
+from pyrebase.pyrebase import PyreResponse
+
+from compas_xr.realtime_database import RealtimeDatabase
+
+
+def test_references_are_independent(config_path):
+    database = RealtimeDatabase(config_path)
+    reference_a = database.construct_reference("a")
+    reference_b = database.construct_child_refrence("b", "c")
+    assert reference_a.path == "a"
+    assert reference_b.path == "b/c"
+
+
+def test_upload_without_waiting(config_path, requests_sent):
+    database = RealtimeDatabase(config_path)
+    reference = database.construct_reference("project")
+    future = database.upload_data_to_reference({"key": 1}, reference, wait=False)
+    future.result()
+    assert requests_sent == [("set", "project", {"key": 1})]
+
+
+def test_cached_reads(config_path, requests_sent, monkeypatch):
+    fetched = []
+
+    def get(self, token=None, json_kwargs=None):
+        fetched.append(self.path)
+        self.path = ""
+        return PyreResponse([Pyre(["key", len(fetched)])], "")
+
+    monkeypatch.setattr(Database, "get", get)
+    database = RealtimeDatabase(config_path, cache_ttl=60)
+
+    assert database.get_data_from_deep_reference(["project", "steps"]) == {"key": 1}
+    data = database.get_data_from_deep_reference(["project", "steps"])
+    data["key"] = "modified"
+    assert database.get_data_from_deep_reference(["project", "steps"]) == {"key": 1}
+    assert fetched == ["project/steps"]
+
+    database.upload_data_to_deep_reference({"key": 2}, ["project", "steps", "0"])
+    assert database.get_data_from_deep_reference(["project", "steps"]) == {"key": 2}
+    assert fetched == ["project/steps", "project/steps"]
+
+
+def test_stream_data(config_path, monkeypatch):
+    streams = []
+
+    def stream(self, stream_handler, token=None, stream_id=None, is_async=True):
+        streams.append((self.path, stream_handler))
+        self.path = ""
+        return stream_handler
+
+    monkeypatch.setattr(Database, "stream", stream)
+    database = RealtimeDatabase(config_path, cache_ttl=60)
+    database._read_cache["project/steps"] = (0.0, {})
+    messages = []
+    stream_handler = database.stream_data_from_deep_reference(messages.append, ["project", "steps"])
+    stream_handler({"event": "put", "path": "/", "data": {"key": 1}})
+
+    assert streams[0][0] == "project/steps"
+    assert messages == [{"event": "put", "path": "/", "data": {"key": 1}}]
+    assert "project/steps" not in database._read_cache
+
+
+def test_update_rejects_non_dict(config_path, monkeypatch):
+    monkeypatch.setattr(Database, "update", lambda *args, **kwargs: pytest.fail("request sent"))
+    database = RealtimeDatabase(config_path)
+    with pytest.raises(TypeError):
+        database.update_data_to_reference([1, 2], database.construct_reference("project"))
+
+
+def test_upload_keeps_guids(config_path, requests_sent):
+    point = Point(1, 2, 3)
+    json_dumps(point, minimal=True)
+    database = RealtimeDatabase(config_path)
+    database.upload_data({"point": point}, "project")
+    assert requests_sent[0][2]["point"]["guid"] == str(point.guid)
+
+
+def test_cached_reads_skip_data_invalidated_during_fetch(config_path, monkeypatch):
+    database = RealtimeDatabase(config_path, cache_ttl=60)
+    fetched = []
+
+    def get(self, token=None, json_kwargs=None):
+        fetched.append(self.path)
+        self.path = ""
+        if len(fetched) == 1:
+            # A background write lands after the data was read but before it is cached.
+            database._invalidate_cache("project/steps/0")
+        return PyreResponse([Pyre(["key", len(fetched)])], "")
+
+    monkeypatch.setattr(Database, "get", get)
+
+    assert database.get_data_from_deep_reference(["project", "steps"]) == {"key": 1}
+    assert database.get_data_from_deep_reference(["project", "steps"]) == {"key": 2}
+    assert database.get_data_from_deep_reference(["project", "steps"]) == {"key": 2}
+    assert fetched == ["project/steps", "project/steps"]
+
+
+def test_update_data_to_reference(config_path, requests_sent):
+    database = RealtimeDatabase(config_path)
+    database.update_data_to_deep_reference({"a": 1, "b/c": [1, 2]}, ["project", "steps"])
+    assert requests_sent == [("update", "project/steps", {"a": 1, "b/c": [1, 2]})]
+
+
+def test_writes_keep_their_order(config_path, requests_sent, monkeypatch):
+    record_set = Database.set
+
+    def slow_set(self, data, token=None, json_kwargs=None):
+        time.sleep(0.1)
+        record_set(self, data, token, json_kwargs)
+
+    monkeypatch.setattr(Database, "set", slow_set)
+    database = RealtimeDatabase(config_path)
+    future = database.upload_data_to_deep_reference({"steps": {}}, ["project", "building_plan"], wait=False)
+    database.update_data_to_deep_reference({"0": {"is_built": True}}, ["project", "building_plan", "steps"])
+    assert future.done()
+    assert [(method, path) for method, path, data in requests_sent] == [("set", "project/building_plan"), ("update", "project/building_plan/steps")]
+
+
+def test_background_upload_keeps_guids(config_path, requests_sent, monkeypatch):
+    record_set = Database.set
+
+    def set_during_minimal_dump(self, data, token=None, json_kwargs=None):
+        # The calling thread serializes with minimal=True while the upload is encoded on the worker.
+        monkeypatch.setattr(DataEncoder, "minimal", True)
+        record_set(self, data, token, json_kwargs)
+
+    monkeypatch.setattr(Database, "set", set_during_minimal_dump)
+    point = Point(1, 2, 3)
+    database = RealtimeDatabase(config_path)
+    database.upload_data({"point": point}, "project", wait=False).result()
+    assert requests_sent[0][2]["point"]["guid"] == str(point.guid)
+
+
+def test_cached_reads_skip_queries_and_drop_expired_data(config_path, monkeypatch):
+    fetched = []
+
+    def get(self, token=None, json_kwargs=None):
+        fetched.append((self.path, dict(self.build_query)))
+        self.path = ""
+        self.build_query = {}
+        return PyreResponse([Pyre(["key", len(fetched)])], "")
+
+    monkeypatch.setattr(Database, "get", get)
+    database = RealtimeDatabase(config_path, cache_ttl=60)
+
+    assert database.get_data_from_reference(database.construct_reference("project").order_by_key()) == {"key": 1}
+    assert database.get_data_from_reference(database.construct_reference("project")) == {"key": 2}
+    assert database.get_data_from_reference(database.construct_reference("project").order_by_key()) == {"key": 3}
+    assert fetched == [("project", {"orderBy": "$key"}), ("project", {}), ("project", {"orderBy": "$key"})]
+    assert list(database._read_cache) == ["project"]
+
+    database._read_cache["expired"] = (time.monotonic() - 60, {})
+    database.get_data_from_reference(database.construct_reference("other"))
+    assert sorted(database._read_cache) == ["other", "project"]
+
+
+def test_missing_config_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(RealtimeDatabase, "_shared_database", None)
+    with pytest.raises(FileNotFoundError):
+        RealtimeDatabase(str(tmp_path / "missing.json"))
+
+
+def test_config_file_without_required_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(RealtimeDatabase, "_shared_database", None)
+    config_path = tmp_path / "config_compas_xr.json"
+    config_path.write_text('{"authDomain": "x123.firebaseapp.com", "databaseURL": "https://x123.firebasedatabase.app", "storageBucket": "x123.appspot.com"}')
+    with pytest.raises(Exception, match="missing the key 'apiKey'"):
+        RealtimeDatabase(str(config_path))
+    assert RealtimeDatabase._shared_database is None